@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import lazyload, raiseload, selectinload
+from sqlmodel import Session, desc, select
+
+from app.models import (
+    JobStatus,
+    SchemaBase,
+    VideoGenerationJob,
+    VideoGenerationJobCreate,
+    VideoGenerationJobDetail,
+)
+
+# Schema keys stored on the detail row rather than on video_generation_jobs
+_DETAIL_FIELDS = frozenset(VideoGenerationJobDetail.model_fields) - {"video_job_id"}
+
+
+def _split_detail(values: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    job_values = {key: value for key, value in values.items() if key not in _DETAIL_FIELDS}
+    detail_values = {key: value for key, value in values.items() if key in _DETAIL_FIELDS}
+    return job_values, detail_values
+
+
+# Built once at import; SQLAlchemy's compiled cache then keys every call (and its selectin follow-ups) on this shape
+_JOBS_WITH_INPUTS = (
+    select(VideoGenerationJob)
+    .order_by(desc(VideoGenerationJob.created_at))
+    .options(
+        selectinload(VideoGenerationJob.reddit_post),  # type: ignore[arg-type]
+        selectinload(VideoGenerationJob.background_video),  # type: ignore[arg-type]
+        selectinload(VideoGenerationJob.tts_config),  # type: ignore[arg-type]
+        selectinload(VideoGenerationJob.subtitle_style),  # type: ignore[arg-type]
+        selectinload(VideoGenerationJob.progress_updates),  # type: ignore[arg-type]
+    )
+)
+
+
+def list_jobs(
+    session: Session, user_id: int, status: Optional[JobStatus] = None, raise_on_lazy: bool = False
+) -> List[VideoGenerationJob]:
+    """List a user's jobs, newest first, with their inputs batch-loaded.
+
+    With raise_on_lazy=True every relationship not loaded up front raises instead of
+    emitting a query, which lets tests catch N+1 regressions.
+    """
+    query = _JOBS_WITH_INPUTS.where(VideoGenerationJob.user_id == user_id)
+    if status is not None:
+        query = query.where(VideoGenerationJob.status == status)
+    if raise_on_lazy:
+        query = query.options(raiseload("*"))
+
+    return list(session.exec(query).all())
+
+
+def get_job_detail(session: Session, job_id: int) -> Optional[VideoGenerationJobDetail]:
+    """Fetch the cold output/log columns of a job, which job listings never load."""
+    return session.get(VideoGenerationJobDetail, job_id)
+
+
+def create_job(session: Session, data: VideoGenerationJobCreate) -> VideoGenerationJob:
+    """Add a job and its detail row, routing detail-only fields such as processing_settings there.
+
+    The caller commits.
+    """
+    job_values, detail_values = _split_detail(data.model_dump())
+    job = VideoGenerationJob.model_validate(job_values)
+    job.detail = VideoGenerationJobDetail.model_validate(detail_values)
+    session.add(job)
+    return job
+
+
+def update_job(session: Session, job_id: int, data: SchemaBase) -> Optional[VideoGenerationJob]:
+    """Apply a VideoGenerationJobUpdate to the job and, for error/output fields, its detail row.
+
+    Only fields set on data are written. The caller commits.
+    """
+    # Skip the mapper's selectin defaults; progress polling must not reload the inputs and every progress row
+    job = session.get(VideoGenerationJob, job_id, options=[lazyload("*")])
+    if job is None:
+        return None
+
+    job_values, detail_values = _split_detail(data.model_dump(exclude_unset=True))
+    job.sqlmodel_update(job_values)
+    session.add(job)
+    if detail_values:
+        detail = get_job_detail(session, job_id) or VideoGenerationJobDetail(video_job_id=job_id)
+        detail.sqlmodel_update(detail_values)
+        session.add(detail)
+    return job
@@ -1,6 +1,37 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlmodel import (
+    SQLModel,
+    Field,
+    Relationship,
+    JSON,
+    CheckConstraint,
+    Column,
+    Computed,
+    DateTime,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Text,
+    column,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
+from sqlalchemy.types import TypeDecorator
+from pydantic import (
+    AwareDatetime,
+    BaseModel,
+    ConfigDict,
+    computed_field,
+    create_model,
+    field_validator,
+    model_validator,
+)
+from pydantic.fields import FieldInfo
+import re
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Annotated, Optional, List, Dict, Any, Sequence, Tuple, Union
 from decimal import Decimal
 from enum import Enum
 
@@ -26,51 +57,175 @@ class VideoFormat(str, Enum):
     AVI = "avi"
 
 
+# Shared field types. SQLModel reads max_length/max_digits from the Annotated metadata for the column
+# types, but drops index/unique/foreign_key there, so fields that need those keep an explicit Field()
+Str20 = Annotated[str, Field(max_length=20)]
+Str100 = Annotated[str, Field(max_length=100)]
+Str200 = Annotated[str, Field(max_length=200)]
+Str255 = Annotated[str, Field(max_length=255)]
+Str500 = Annotated[str, Field(max_length=500)]
+OptionalStr128 = Annotated[Optional[str], Field(max_length=128)]
+OptionalStr255 = Annotated[Optional[str], Field(max_length=255)]
+OptionalStr500 = Annotated[Optional[str], Field(max_length=500)]
+Seconds = Annotated[Decimal, Field(max_digits=6, decimal_places=2)]
+Percentage = Annotated[Decimal, Field(max_digits=5, decimal_places=2, ge=0.0, le=100.0)]
+VoiceFactor = Annotated[Decimal, Field(max_digits=3, decimal_places=2, ge=0.1, le=2.0)]
+Ratio = Annotated[float, Field(ge=0.0, le=1.0)]
+
+
+# Binary JSONB on PostgreSQL (indexable, no per-row reparse); plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+# IDENTITY primary keys; a larger cache lets bulk-inserted tables reserve ids in blocks instead of per row
+def _id_column(cache: int = 1) -> Column:
+    return Column(Integer, Identity(always=False, start=1, cache=cache), primary_key=True)
+
+
+def _timestamp_column(nullable: bool = True) -> Column:
+    return Column(DateTime(timezone=True), nullable=nullable)
+
+
+# Timestamps are filled in by the database, so inserts (including bulk ones) never compute them in Python
+def _created_at_column(index: bool = False) -> Column:
+    return Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=index)
+
+
+def _updated_at_column() -> Column:
+    return Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+# Enums are stored as their plain string values guarded by a CHECK constraint rather than a native ENUM type
+class _EnumString(TypeDecorator):
+    """VARCHAR(20) holding an enum's value; rows load back as members, matching the field annotations."""
+
+    impl = String(20)
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        return value.value if isinstance(value, Enum) else value
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        return self.enum_class(value) if value is not None else None
+
+
+def _enum_column(name: str, default: Enum, index: bool = False) -> Column:
+    values = ", ".join(f"'{member.value}'" for member in type(default))
+    return Column(
+        _EnumString(type(default)),
+        CheckConstraint(f"{name} IN ({values})"),
+        nullable=False,
+        server_default=default.value,
+        index=index,
+    )
+
+
+# Text search configuration shared by RedditPost.search_vec and the queries that match against it
+SEARCH_CONFIG = "english"
+
+_SEARCH_VEC = Column(
+    "search_vec",
+    TSVECTOR,
+    Computed(f"to_tsvector('{SEARCH_CONFIG}', coalesce(title, '') || ' ' || coalesce(content, ''))", persisted=True),
+)
+
+# Colors are stored packed as 24-bit RGB integers and exposed as "#RRGGBB" strings
+HEX_COLOR_PATTERN = r"^#[0-9A-Fa-f]{6}$"
+STYLE_COLORS = ("font_color", "background_color", "outline_color")
+HexColor = Annotated[str, Field(schema_extra={"pattern": HEX_COLOR_PATTERN})]
+OptionalHexColor = Annotated[Optional[str], Field(schema_extra={"pattern": HEX_COLOR_PATTERN})]
+
+
+def hex_to_rgb(value: str) -> int:
+    if not re.match(HEX_COLOR_PATTERN, value):
+        raise ValueError(f"Invalid color {value!r}, expected #RRGGBB")
+    return int(value.removeprefix("#"), 16)
+
+
+def rgb_to_hex(value: int) -> str:
+    return f"#{value:06X}"
+
+
+def pack_style_colors(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace "#RRGGBB" color keys with their packed *_rgb equivalents."""
+    packed = dict(data)
+    for name in STYLE_COLORS:
+        if name in packed:
+            value = packed.pop(name)
+            packed[f"{name}_rgb"] = hex_to_rgb(value) if value is not None else None
+    return packed
+
+
 # Persistent models (stored in database)
 class User(SQLModel, table=True):
     __tablename__ = "users"  # type: ignore[assignment]
+    # Case-insensitive lookups (lower(email) = lower(:login)) stay index seeks
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(column("email")), unique=True),
+        Index("ix_users_username_lower", func.lower(column("username")), unique=True),
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
     username: str = Field(max_length=100, unique=True)
     email: str = Field(max_length=255, unique=True)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_updated_at_column())
 
     # API credentials (encrypted in production)
-    reddit_client_id: Optional[str] = Field(default=None, max_length=500)
-    reddit_client_secret: Optional[str] = Field(default=None, max_length=500)
-    tts_api_key: Optional[str] = Field(default=None, max_length=500)
-
-    # Relationships
-    reddit_posts: List["RedditPost"] = Relationship(back_populates="user")
-    background_videos: List["BackgroundVideo"] = Relationship(back_populates="user")
-    video_jobs: List["VideoGenerationJob"] = Relationship(back_populates="user")
-    tts_configs: List["TTSConfiguration"] = Relationship(back_populates="user")
-    subtitle_styles: List["SubtitleStyle"] = Relationship(back_populates="user")
+    reddit_client_id: OptionalStr128 = None
+    reddit_client_secret: OptionalStr128 = None
+    tts_api_key: OptionalStr500 = None
+
+    # Relationships. Read-only and never loaded implicitly: a user's rows are fetched through
+    # filtered queries (list_jobs, list_posts), so touching these collections is an N+1 bug
+    reddit_posts: List["RedditPost"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "viewonly": True}
+    )
+    background_videos: List["BackgroundVideo"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "viewonly": True}
+    )
+    video_jobs: List["VideoGenerationJob"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "viewonly": True}
+    )
+    tts_configs: List["TTSConfiguration"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "viewonly": True}
+    )
+    subtitle_styles: List["SubtitleStyle"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "viewonly": True}
+    )
 
 
 class RedditPost(SQLModel, table=True):
     __tablename__ = "reddit_posts"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_reddit_search", "search_vec", postgresql_using="gin"),)
+    __mapper_args__ = {"properties": {"search_vec": deferred(_SEARCH_VEC)}}
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
     reddit_id: str = Field(max_length=50, unique=True, index=True)
     subreddit: str = Field(max_length=100, index=True)
-    title: str = Field(max_length=500)
+    title: str = Field(max_length=300)
     content: str = Field(default="")
-    author: str = Field(max_length=100)
+    author: Str100
     score: int = Field(default=0)
     num_comments: int = Field(default=0)
-    created_utc: datetime
-    url: str = Field(max_length=500)
-    permalink: str = Field(max_length=500)
+    created_utc: datetime = Field(sa_column=_timestamp_column(nullable=False))
+    url: str = Field(sa_type=Text)
+    permalink: str = Field(sa_type=Text)
 
     # Metadata
     word_count: int = Field(default=0)
-    estimated_duration: Decimal = Field(default=Decimal("0"), decimal_places=2)  # in seconds
+    estimated_duration: Seconds = Decimal("0")
+
+    # Maintained by PostgreSQL from title and content and deferred, so only search_posts' WHERE/ORDER BY reads it
+    search_vec: Optional[str] = Field(default=None, sa_column=_SEARCH_VEC, exclude=True)
 
     user_id: int = Field(foreign_key="users.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_created_at_column())
 
     # Relationships
     user: User = Relationship(back_populates="reddit_posts")
@@ -79,25 +234,26 @@ class RedditPost(SQLModel, table=True):
 
 class BackgroundVideo(SQLModel, table=True):
     __tablename__ = "background_videos"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_bgvideo_tags_gin", "tags", postgresql_using="gin"),)
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    filename: str = Field(max_length=255)
-    original_filename: str = Field(max_length=255)
-    file_path: str = Field(max_length=500)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
+    filename: Str255
+    original_filename: Str255
+    file_path: Str500
     file_size: int  # in bytes
-    duration: Decimal = Field(decimal_places=2)  # in seconds
+    duration: Seconds
     width: int
     height: int
-    fps: Decimal = Field(decimal_places=2)
-    format: VideoFormat = Field(default=VideoFormat.MP4)
+    fps: Decimal = Field(max_digits=5, decimal_places=2)
+    format: VideoFormat = Field(default=VideoFormat.MP4, sa_column=_enum_column("format", VideoFormat.MP4))
 
     # Metadata
-    description: str = Field(default="", max_length=500)
-    tags: List[str] = Field(default=[], sa_column=Column(JSON))
+    description: Str500 = ""
+    tags: List[str] = Field(default_factory=list, sa_column=Column(JSONVariant))
 
     user_id: int = Field(foreign_key="users.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_updated_at_column())
 
     # Relationships
     user: User = Relationship(back_populates="background_videos")
@@ -107,24 +263,24 @@ class BackgroundVideo(SQLModel, table=True):
 class TTSConfiguration(SQLModel, table=True):
     __tablename__ = "tts_configurations"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    name: str = Field(max_length=100)
-    provider: TTSProvider = Field(default=TTSProvider.OPENAI)
-    voice_id: str = Field(max_length=100)
-    voice_name: str = Field(max_length=100)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
+    name: Str100
+    provider: TTSProvider = Field(default=TTSProvider.OPENAI, sa_column=_enum_column("provider", TTSProvider.OPENAI))
+    voice_id: Str100
+    voice_name: Str100
 
     # Voice settings
-    speed: Decimal = Field(default=Decimal("1.0"), decimal_places=2, ge=0.1, le=3.0)
-    pitch: Decimal = Field(default=Decimal("1.0"), decimal_places=2, ge=0.1, le=2.0)
-    volume: Decimal = Field(default=Decimal("1.0"), decimal_places=2, ge=0.1, le=2.0)
+    speed: Decimal = Field(default=Decimal("1.0"), max_digits=3, decimal_places=2, ge=0.1, le=3.0)
+    pitch: VoiceFactor = Decimal("1.0")
+    volume: VoiceFactor = Decimal("1.0")
 
     # Additional settings per provider
-    settings: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    settings: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONVariant))
 
     is_default: bool = Field(default=False)
     user_id: int = Field(foreign_key="users.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_updated_at_column())
 
     # Relationships
     user: User = Relationship(back_populates="tts_configs")
@@ -134,76 +290,124 @@ class TTSConfiguration(SQLModel, table=True):
 class SubtitleStyle(SQLModel, table=True):
     __tablename__ = "subtitle_styles"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    name: str = Field(max_length=100)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
+    name: Str100
 
     # Font settings
-    font_family: str = Field(default="Arial", max_length=100)
+    font_family: Str100 = "Arial"
     font_size: int = Field(default=24, ge=10, le=72)
-    font_weight: str = Field(default="bold", max_length=20)
-    font_color: str = Field(default="#FFFFFF", max_length=7)  # hex color
+    font_weight: Str20 = "bold"
+    font_color_rgb: int = Field(default=0xFFFFFF, ge=0, le=0xFFFFFF)
 
     # Background/outline settings
-    background_color: Optional[str] = Field(default=None, max_length=7)  # hex color
-    background_opacity: Decimal = Field(default=Decimal("0.8"), decimal_places=2, ge=0.0, le=1.0)
-    outline_color: str = Field(default="#000000", max_length=7)  # hex color
+    background_color_rgb: Optional[int] = Field(default=None, ge=0, le=0xFFFFFF)
+    background_opacity: Ratio = 0.8
+    outline_color_rgb: int = Field(default=0x000000, ge=0, le=0xFFFFFF)
     outline_width: int = Field(default=2, ge=0, le=10)
 
     # Position settings
-    position_x: Decimal = Field(default=Decimal("0.5"), decimal_places=3, ge=0.0, le=1.0)  # relative position
-    position_y: Decimal = Field(default=Decimal("0.8"), decimal_places=3, ge=0.0, le=1.0)  # relative position
-    alignment: str = Field(default="center", max_length=20)  # left, center, right
+    position_x: Ratio = 0.5  # relative position
+    position_y: Ratio = 0.8  # relative position
+    alignment: Str20 = "center"  # left, center, right
 
     # Animation settings
-    fade_in_duration: Decimal = Field(default=Decimal("0.5"), decimal_places=2, ge=0.0)
-    fade_out_duration: Decimal = Field(default=Decimal("0.5"), decimal_places=2, ge=0.0)
+    fade_in_duration: float = Field(default=0.5, ge=0.0)
+    fade_out_duration: float = Field(default=0.5, ge=0.0)
 
     # Additional style options
-    settings: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    settings: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONVariant))
 
     is_default: bool = Field(default=False)
     user_id: int = Field(foreign_key="users.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_updated_at_column())
 
     # Relationships
     user: User = Relationship(back_populates="subtitle_styles")
     video_jobs: List["VideoGenerationJob"] = Relationship(back_populates="subtitle_style")
 
+    def __init__(self, **data: Any):
+        # Table models skip validation in __init__, so hex keyword arguments are packed here
+        super().__init__(**pack_style_colors(data))
+
+    @model_validator(mode="before")
+    @classmethod
+    def pack_hex_colors(cls, data: Any) -> Any:
+        # Lets SubtitleStyle.model_validate(SubtitleStyleCreate(...)) take the hex colors as-is
+        if isinstance(data, BaseModel):
+            data = data.model_dump()
+        return pack_style_colors(data) if isinstance(data, dict) else data
+
+    def sqlmodel_update(self, obj: Union[Dict[str, Any], BaseModel], *, update: Optional[Dict[str, Any]] = None):
+        if isinstance(obj, BaseModel):
+            obj = obj.model_dump(exclude_unset=True)
+        return super().sqlmodel_update(pack_style_colors(obj), update=pack_style_colors(update or {}))
+
+    @computed_field
+    @property
+    def font_color(self) -> str:
+        return rgb_to_hex(self.font_color_rgb)
+
+    @font_color.setter
+    def font_color(self, value: str) -> None:
+        self.font_color_rgb = hex_to_rgb(value)
+
+    @computed_field
+    @property
+    def background_color(self) -> Optional[str]:
+        return rgb_to_hex(self.background_color_rgb) if self.background_color_rgb is not None else None
+
+    @background_color.setter
+    def background_color(self, value: Optional[str]) -> None:
+        self.background_color_rgb = hex_to_rgb(value) if value is not None else None
+
+    @computed_field
+    @property
+    def outline_color(self) -> str:
+        return rgb_to_hex(self.outline_color_rgb)
+
+    @outline_color.setter
+    def outline_color(self, value: str) -> None:
+        self.outline_color_rgb = hex_to_rgb(value)
+
 
 class VideoGenerationJob(SQLModel, table=True):
     __tablename__ = "video_generation_jobs"  # type: ignore[assignment]
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    job_name: str = Field(max_length=200)
-    status: JobStatus = Field(default=JobStatus.PENDING)
+    __table_args__ = (
+        Index("ix_jobs_user_status_created", "user_id", "status", "created_at"),
+        # Partial index for the worker queue
+        Index(
+            "ix_jobs_active",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+            sqlite_where=text("status IN ('pending', 'processing')"),
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
+    job_name: Str200
+    status: JobStatus = Field(
+        default=JobStatus.PENDING, sa_column=_enum_column("status", JobStatus.PENDING, index=True)
+    )
 
     # Processing settings
-    target_duration: Decimal = Field(decimal_places=2, ge=1.0)  # in seconds
+    target_duration: Decimal = Field(max_digits=6, decimal_places=2, ge=1.0)  # in seconds
     output_width: int = Field(default=1080, ge=480, le=1920)
     output_height: int = Field(default=1920, ge=480, le=1920)
     output_fps: int = Field(default=30, ge=24, le=60)
-    output_format: VideoFormat = Field(default=VideoFormat.MP4)
+    output_format: VideoFormat = Field(
+        default=VideoFormat.MP4, sa_column=_enum_column("output_format", VideoFormat.MP4)
+    )
 
     # Processing progress
-    progress_percentage: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0.0, le=100.0)
-    current_step: str = Field(default="", max_length=200)
-    estimated_completion: Optional[datetime] = Field(default=None)
-
-    # Output file info
-    output_filename: Optional[str] = Field(default=None, max_length=255)
-    output_file_path: Optional[str] = Field(default=None, max_length=500)
-    output_file_size: Optional[int] = Field(default=None)  # in bytes
+    progress_percentage: Percentage = Decimal("0")
+    current_step: Str200 = ""
 
-    # Error handling
-    error_message: Optional[str] = Field(default=None, max_length=1000)
+    # Retry handling
     retry_count: int = Field(default=0, ge=0)
     max_retries: int = Field(default=3, ge=0)
 
-    # Processing metadata
-    processing_log: List[str] = Field(default=[], sa_column=Column(JSON))
-    processing_settings: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-
     # Foreign keys
     user_id: int = Field(foreign_key="users.id")
     reddit_post_id: int = Field(foreign_key="reddit_posts.id")
@@ -212,163 +416,257 @@ class VideoGenerationJob(SQLModel, table=True):
     subtitle_style_id: int = Field(foreign_key="subtitle_styles.id")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    started_at: Optional[datetime] = Field(default=None)
-    completed_at: Optional[datetime] = Field(default=None)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_created_at_column(index=True))
+    started_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    completed_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_updated_at_column())
 
     # Relationships
+    # Inputs rendered alongside every job are batch-loaded with one IN query per relationship
     user: User = Relationship(back_populates="video_jobs")
-    reddit_post: RedditPost = Relationship(back_populates="video_jobs")
-    background_video: BackgroundVideo = Relationship(back_populates="video_jobs")
-    tts_config: TTSConfiguration = Relationship(back_populates="video_jobs")
-    subtitle_style: SubtitleStyle = Relationship(back_populates="video_jobs")
-    progress_updates: List["JobProgressUpdate"] = Relationship(back_populates="video_job")
+    reddit_post: RedditPost = Relationship(back_populates="video_jobs", sa_relationship_kwargs={"lazy": "selectin"})
+    background_video: BackgroundVideo = Relationship(
+        back_populates="video_jobs", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    tts_config: TTSConfiguration = Relationship(
+        back_populates="video_jobs", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    subtitle_style: SubtitleStyle = Relationship(
+        back_populates="video_jobs", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    progress_updates: List["JobProgressUpdate"] = Relationship(
+        back_populates="video_job",
+        sa_relationship_kwargs={
+            "lazy": "selectin",
+            "order_by": "JobProgressUpdate.created_at",
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        },
+    )
+    # Cold columns live in a side table; fetch them with get_job_detail, implicit access raises.
+    # The FK's ON DELETE CASCADE removes the row when a job is deleted, without loading it first
+    detail: Optional["VideoGenerationJobDetail"] = Relationship(
+        back_populates="video_job",
+        sa_relationship_kwargs={
+            "lazy": "raise",
+            "uselist": False,
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        },
+    )
+
+
+class VideoGenerationJobDetail(SQLModel, table=True):
+    __tablename__ = "video_generation_job_details"  # type: ignore[assignment]
+
+    video_job_id: Optional[int] = Field(
+        default=None, foreign_key="video_generation_jobs.id", ondelete="CASCADE", primary_key=True
+    )
+    estimated_completion: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+
+    # Output file info
+    output_filename: OptionalStr255 = None
+    output_file_path: OptionalStr500 = None
+    output_file_size: Optional[int] = Field(default=None)  # in bytes
+
+    # Error handling
+    error_message: Optional[str] = Field(default=None, sa_type=Text)
+
+    # Processing metadata
+    processing_log: List[str] = Field(default_factory=list, sa_column=Column(JSONVariant))
+    processing_settings: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONVariant))
+
+    # Relationships
+    video_job: VideoGenerationJob = Relationship(back_populates="detail")
 
 
 class JobProgressUpdate(SQLModel, table=True):
     __tablename__ = "job_progress_updates"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_progress_job_time", "video_job_id", "created_at"),)
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    progress_percentage: Decimal = Field(decimal_places=2, ge=0.0, le=100.0)
-    step_name: str = Field(max_length=200)
-    step_description: str = Field(default="", max_length=500)
+    id: Optional[int] = Field(default=None, sa_column=_id_column(cache=100))
+    progress_percentage: Percentage
+    step_name: Str200
+    step_description: Str500 = ""
 
     # Additional data for real-time updates
-    update_metadata: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    update_metadata: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONVariant))
 
-    video_job_id: int = Field(foreign_key="video_generation_jobs.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    video_job_id: int = Field(foreign_key="video_generation_jobs.id", ondelete="CASCADE")
+    created_at: Optional[datetime] = Field(default=None, sa_column=_created_at_column())
 
     # Relationships
     video_job: VideoGenerationJob = Relationship(back_populates="progress_updates")
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
-class UserCreate(SQLModel, table=False):
-    username: str = Field(max_length=100)
-    email: str = Field(max_length=255)
-    reddit_client_id: Optional[str] = Field(default=None, max_length=500)
-    reddit_client_secret: Optional[str] = Field(default=None, max_length=500)
-    tts_api_key: Optional[str] = Field(default=None, max_length=500)
-
-
-class UserUpdate(SQLModel, table=False):
-    username: Optional[str] = Field(default=None, max_length=100)
-    email: Optional[str] = Field(default=None, max_length=255)
-    is_active: Optional[bool] = Field(default=None)
-    reddit_client_id: Optional[str] = Field(default=None, max_length=500)
-    reddit_client_secret: Optional[str] = Field(default=None, max_length=500)
-    tts_api_key: Optional[str] = Field(default=None, max_length=500)
-
-
-class RedditPostCreate(SQLModel, table=False):
+class SchemaBase(SQLModel, table=False):
+    # Reject unknown keys up front instead of carrying them through validation
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)  # type: ignore[assignment]
+
+
+def make_partial(*sources: type[SQLModel], include: Sequence[str], name: Optional[str] = None) -> type[SchemaBase]:
+    """Build a partial-update schema from existing model fields.
+
+    Each included field keeps its type and constraints from the first source that declares it,
+    but becomes optional with a None default. Datetimes must be timezone-aware. The class is
+    named "<FirstSource>Update" unless name is given.
+    """
+    fields: Dict[str, Tuple[Any, FieldInfo]] = {}
+    for field_name in include:
+        source = next((model for model in sources if field_name in model.model_fields), None)
+        if source is None:
+            names = ", ".join(model.__name__ for model in sources)
+            raise KeyError(f"make_partial: no field {field_name!r} on {names}")
+        field_info = source.model_fields[field_name]
+        annotation = field_info.annotation
+        if annotation in (datetime, Optional[datetime]):
+            # Columns are TIMESTAMPTZ; reject naive input rather than guess its zone
+            annotation = AwareDatetime
+        fields[field_name] = (
+            Optional[annotation],
+            FieldInfo.merge_field_infos(field_info, default=None, default_factory=None),
+        )
+    return create_model(
+        name or f"{sources[0].__name__}Update",
+        __base__=SchemaBase,
+        __module__=__name__,
+        **fields,  # type: ignore[arg-type]
+    )
+
+
+class UserCreate(SchemaBase, table=False):
+    username: Str100
+    email: Str255
+    reddit_client_id: OptionalStr128 = None
+    reddit_client_secret: OptionalStr128 = None
+    tts_api_key: OptionalStr500 = None
+
+    @field_validator("username", "email")
+    @classmethod
+    def normalize_case(cls, value: str) -> str:
+        return value.lower()
+
+
+class UserUpdate(
+    make_partial(
+        User,
+        include=("username", "email", "is_active", "reddit_client_id", "reddit_client_secret", "tts_api_key"),
+        name="UserUpdateBase",
+    ),
+    table=False,
+):
+    @field_validator("username", "email")
+    @classmethod
+    def normalize_case(cls, value: Optional[str]) -> Optional[str]:
+        return value.lower() if value is not None else None
+
+
+class RedditPostCreate(SchemaBase, table=False):
     reddit_id: str = Field(max_length=50)
-    subreddit: str = Field(max_length=100)
-    title: str = Field(max_length=500)
+    subreddit: Str100
+    title: str = Field(max_length=300)
     content: str = Field(default="")
-    author: str = Field(max_length=100)
+    author: Str100
     score: int = Field(default=0)
     num_comments: int = Field(default=0)
-    created_utc: datetime
-    url: str = Field(max_length=500)
-    permalink: str = Field(max_length=500)
+    created_utc: AwareDatetime
+    url: str
+    permalink: str
     word_count: int = Field(default=0)
-    estimated_duration: Decimal = Field(default=Decimal("0"), decimal_places=2)
+    estimated_duration: Seconds = Decimal("0")
     user_id: int
 
 
-class BackgroundVideoCreate(SQLModel, table=False):
-    filename: str = Field(max_length=255)
-    original_filename: str = Field(max_length=255)
-    file_path: str = Field(max_length=500)
+class BackgroundVideoCreate(SchemaBase, table=False):
+    filename: Str255
+    original_filename: Str255
+    file_path: Str500
     file_size: int
-    duration: Decimal = Field(decimal_places=2)
+    duration: Seconds
     width: int
     height: int
-    fps: Decimal = Field(decimal_places=2)
+    fps: Decimal = Field(max_digits=5, decimal_places=2)
     format: VideoFormat = Field(default=VideoFormat.MP4)
-    description: str = Field(default="", max_length=500)
-    tags: List[str] = Field(default=[])
+    description: Str500 = ""
+    tags: List[str] = Field(default_factory=list)
     user_id: int
 
 
-class BackgroundVideoUpdate(SQLModel, table=False):
-    description: Optional[str] = Field(default=None, max_length=500)
-    tags: Optional[List[str]] = Field(default=None)
+BackgroundVideoUpdate = make_partial(BackgroundVideo, include=("description", "tags"))
 
 
-class TTSConfigurationCreate(SQLModel, table=False):
-    name: str = Field(max_length=100)
+class TTSConfigurationCreate(SchemaBase, table=False):
+    name: Str100
     provider: TTSProvider = Field(default=TTSProvider.OPENAI)
-    voice_id: str = Field(max_length=100)
-    voice_name: str = Field(max_length=100)
-    speed: Decimal = Field(default=Decimal("1.0"), decimal_places=2, ge=0.1, le=3.0)
-    pitch: Decimal = Field(default=Decimal("1.0"), decimal_places=2, ge=0.1, le=2.0)
-    volume: Decimal = Field(default=Decimal("1.0"), decimal_places=2, ge=0.1, le=2.0)
-    settings: Dict[str, Any] = Field(default={})
+    voice_id: Str100
+    voice_name: Str100
+    speed: Decimal = Field(default=Decimal("1.0"), max_digits=3, decimal_places=2, ge=0.1, le=3.0)
+    pitch: VoiceFactor = Decimal("1.0")
+    volume: VoiceFactor = Decimal("1.0")
+    settings: Dict[str, Any] = Field(default_factory=dict)
     is_default: bool = Field(default=False)
     user_id: int
 
 
-class TTSConfigurationUpdate(SQLModel, table=False):
-    name: Optional[str] = Field(default=None, max_length=100)
-    voice_id: Optional[str] = Field(default=None, max_length=100)
-    voice_name: Optional[str] = Field(default=None, max_length=100)
-    speed: Optional[Decimal] = Field(default=None, decimal_places=2, ge=0.1, le=3.0)
-    pitch: Optional[Decimal] = Field(default=None, decimal_places=2, ge=0.1, le=2.0)
-    volume: Optional[Decimal] = Field(default=None, decimal_places=2, ge=0.1, le=2.0)
-    settings: Optional[Dict[str, Any]] = Field(default=None)
-    is_default: Optional[bool] = Field(default=None)
+TTSConfigurationUpdate = make_partial(
+    TTSConfiguration,
+    include=("name", "voice_id", "voice_name", "speed", "pitch", "volume", "settings", "is_default"),
+)
 
 
-class SubtitleStyleCreate(SQLModel, table=False):
-    name: str = Field(max_length=100)
-    font_family: str = Field(default="Arial", max_length=100)
+class SubtitleStyleCreate(SchemaBase, table=False):
+    name: Str100
+    font_family: Str100 = "Arial"
     font_size: int = Field(default=24, ge=10, le=72)
-    font_weight: str = Field(default="bold", max_length=20)
-    font_color: str = Field(default="#FFFFFF", max_length=7)
-    background_color: Optional[str] = Field(default=None, max_length=7)
-    background_opacity: Decimal = Field(default=Decimal("0.8"), decimal_places=2, ge=0.0, le=1.0)
-    outline_color: str = Field(default="#000000", max_length=7)
+    font_weight: Str20 = "bold"
+    font_color: HexColor = "#FFFFFF"
+    background_color: OptionalHexColor = None
+    background_opacity: Ratio = 0.8
+    outline_color: HexColor = "#000000"
     outline_width: int = Field(default=2, ge=0, le=10)
-    position_x: Decimal = Field(default=Decimal("0.5"), decimal_places=3, ge=0.0, le=1.0)
-    position_y: Decimal = Field(default=Decimal("0.8"), decimal_places=3, ge=0.0, le=1.0)
-    alignment: str = Field(default="center", max_length=20)
-    fade_in_duration: Decimal = Field(default=Decimal("0.5"), decimal_places=2, ge=0.0)
-    fade_out_duration: Decimal = Field(default=Decimal("0.5"), decimal_places=2, ge=0.0)
-    settings: Dict[str, Any] = Field(default={})
+    position_x: Ratio = 0.5
+    position_y: Ratio = 0.8
+    alignment: Str20 = "center"
+    fade_in_duration: float = Field(default=0.5, ge=0.0)
+    fade_out_duration: float = Field(default=0.5, ge=0.0)
+    settings: Dict[str, Any] = Field(default_factory=dict)
     is_default: bool = Field(default=False)
     user_id: int
 
 
-class SubtitleStyleUpdate(SQLModel, table=False):
-    name: Optional[str] = Field(default=None, max_length=100)
-    font_family: Optional[str] = Field(default=None, max_length=100)
-    font_size: Optional[int] = Field(default=None, ge=10, le=72)
-    font_weight: Optional[str] = Field(default=None, max_length=20)
-    font_color: Optional[str] = Field(default=None, max_length=7)
-    background_color: Optional[str] = Field(default=None, max_length=7)
-    background_opacity: Optional[Decimal] = Field(default=None, decimal_places=2, ge=0.0, le=1.0)
-    outline_color: Optional[str] = Field(default=None, max_length=7)
-    outline_width: Optional[int] = Field(default=None, ge=0, le=10)
-    position_x: Optional[Decimal] = Field(default=None, decimal_places=3, ge=0.0, le=1.0)
-    position_y: Optional[Decimal] = Field(default=None, decimal_places=3, ge=0.0, le=1.0)
-    alignment: Optional[str] = Field(default=None, max_length=20)
-    fade_in_duration: Optional[Decimal] = Field(default=None, decimal_places=2, ge=0.0)
-    fade_out_duration: Optional[Decimal] = Field(default=None, decimal_places=2, ge=0.0)
-    settings: Optional[Dict[str, Any]] = Field(default=None)
-    is_default: Optional[bool] = Field(default=None)
-
-
-class VideoGenerationJobCreate(SQLModel, table=False):
-    job_name: str = Field(max_length=200)
-    target_duration: Decimal = Field(decimal_places=2, ge=1.0)
+SubtitleStyleUpdate = make_partial(
+    SubtitleStyle,
+    SubtitleStyleCreate,
+    include=(
+        "name",
+        "font_family",
+        "font_size",
+        "font_weight",
+        "font_color",
+        "background_color",
+        "background_opacity",
+        "outline_color",
+        "outline_width",
+        "position_x",
+        "position_y",
+        "alignment",
+        "fade_in_duration",
+        "fade_out_duration",
+        "settings",
+        "is_default",
+    ),
+)
+
+
+class VideoGenerationJobCreate(SchemaBase, table=False):
+    job_name: Str200
+    target_duration: Decimal = Field(max_digits=6, decimal_places=2, ge=1.0)
     output_width: int = Field(default=1080, ge=480, le=1920)
     output_height: int = Field(default=1920, ge=480, le=1920)
     output_fps: int = Field(default=30, ge=24, le=60)
     output_format: VideoFormat = Field(default=VideoFormat.MP4)
-    processing_settings: Dict[str, Any] = Field(default={})
+    processing_settings: Dict[str, Any] = Field(default_factory=dict)
     user_id: int
     reddit_post_id: int
     background_video_id: int
@@ -376,21 +674,26 @@ class VideoGenerationJobCreate(SQLModel, table=False):
     subtitle_style_id: int
 
 
-class VideoGenerationJobUpdate(SQLModel, table=False):
-    job_name: Optional[str] = Field(default=None, max_length=200)
-    status: Optional[JobStatus] = Field(default=None)
-    progress_percentage: Optional[Decimal] = Field(default=None, decimal_places=2, ge=0.0, le=100.0)
-    current_step: Optional[str] = Field(default=None, max_length=200)
-    estimated_completion: Optional[datetime] = Field(default=None)
-    output_filename: Optional[str] = Field(default=None, max_length=255)
-    output_file_path: Optional[str] = Field(default=None, max_length=500)
-    output_file_size: Optional[int] = Field(default=None)
-    error_message: Optional[str] = Field(default=None, max_length=1000)
-
-
-class JobProgressUpdateCreate(SQLModel, table=False):
-    progress_percentage: Decimal = Field(decimal_places=2, ge=0.0, le=100.0)
-    step_name: str = Field(max_length=200)
-    step_description: str = Field(default="", max_length=500)
-    update_metadata: Dict[str, Any] = Field(default={})
+VideoGenerationJobUpdate = make_partial(
+    VideoGenerationJob,
+    VideoGenerationJobDetail,
+    include=(
+        "job_name",
+        "status",
+        "progress_percentage",
+        "current_step",
+        "estimated_completion",
+        "output_filename",
+        "output_file_path",
+        "output_file_size",
+        "error_message",
+    ),
+)
+
+
+class JobProgressUpdateCreate(SchemaBase, table=False):
+    progress_percentage: Percentage
+    step_name: Str200
+    step_description: Str500 = ""
+    update_metadata: Dict[str, Any] = Field(default_factory=dict)
     video_job_id: int
@@ -0,0 +1,27 @@
+from typing import List
+
+from sqlmodel import Session, desc, func, select
+
+from app.models import SEARCH_CONFIG, RedditPost
+
+
+def list_posts(session: Session, user_id: int) -> List[RedditPost]:
+    """A user's posts, newest first; use instead of the unloadable User.reddit_posts."""
+    statement = select(RedditPost).where(RedditPost.user_id == user_id).order_by(desc(RedditPost.created_at))
+    return list(session.exec(statement).all())
+
+
+def search_posts(session: Session, user_id: int, query: str, limit: int = 50) -> List[RedditPost]:
+    """Full-text search over a user's post titles and content, best matches first.
+
+    Matches against the generated search_vec column, so the GIN index serves the lookup
+    instead of an ILIKE scan of every row.
+    """
+    ts_query = func.plainto_tsquery(SEARCH_CONFIG, query)
+    statement = (
+        select(RedditPost)
+        .where(RedditPost.user_id == user_id, RedditPost.search_vec.op("@@")(ts_query))  # type: ignore[union-attr]
+        .order_by(desc(func.ts_rank(RedditPost.search_vec, ts_query)))
+        .limit(limit)
+    )
+    return list(session.exec(statement).all())
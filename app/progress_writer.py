@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlmodel import Session, insert
+
+from app.database import get_session
+from app.models import JobProgressUpdate, JobProgressUpdateCreate
+
+logger = logging.getLogger(__name__)
+
+
+def write_progress_updates(session: Session, updates: Sequence[JobProgressUpdateCreate]) -> None:
+    """Insert progress rows as one executemany batch, skipping the ORM unit of work.
+
+    created_at is left to the server default, so rows only carry the submitted fields.
+    """
+    if not updates:
+        return
+    table = JobProgressUpdate.__table__  # type: ignore[attr-defined]
+    session.connection().execute(insert(table), [update.model_dump() for update in updates])
+
+
+class ProgressWriter:
+    """Coalesces progress updates in memory and writes them in batches.
+
+    A batch is flushed once batch_size updates are queued or flush_interval seconds have
+    passed since its first update, whichever comes first.
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.25):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[Optional[JobProgressUpdateCreate]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush everything queued so far and stop the background task."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    def put(self, update: JobProgressUpdateCreate) -> None:
+        self._queue.put_nowait(update)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+
+            batch: List[JobProgressUpdateCreate] = [first]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    update = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if update is None:
+                    stopping = True
+                    break
+                batch.append(update)
+
+            await asyncio.to_thread(self._flush, batch)
+            if stopping:
+                return
+
+    def _flush(self, batch: List[JobProgressUpdateCreate]) -> None:
+        # Progress rows are informational; a failed batch must not take down the job runner
+        try:
+            self._write(batch)
+        except IntegrityError:
+            # Usually one stale job (deleted meanwhile) in a mixed batch; retry per job so the others still land
+            by_job: Dict[int, List[JobProgressUpdateCreate]] = {}
+            for update in batch:
+                by_job.setdefault(update.video_job_id, []).append(update)
+            for job_id, updates in by_job.items():
+                try:
+                    self._write(updates)
+                except SQLAlchemyError as e:
+                    logger.warning(f"Dropped {len(updates)} progress updates for job {job_id}: {e}")
+        except SQLAlchemyError as e:
+            logger.exception(f"Dropped {len(batch)} progress updates: {e}")
+
+    def _write(self, updates: List[JobProgressUpdateCreate]) -> None:
+        with get_session() as session:
+            write_progress_updates(session, updates)
+            session.commit()
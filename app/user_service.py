@@ -0,0 +1,15 @@
+from typing import Optional
+
+from sqlmodel import Session, func, select
+
+from app.models import User
+
+
+def get_user_by_email(session: Session, email: str) -> Optional[User]:
+    """Case-insensitive lookup served by the lower(email) index."""
+    return session.exec(select(User).where(func.lower(User.email) == email.lower())).first()
+
+
+def get_user_by_username(session: Session, username: str) -> Optional[User]:
+    """Case-insensitive lookup served by the lower(username) index."""
+    return session.exec(select(User).where(func.lower(User.username) == username.lower())).first()
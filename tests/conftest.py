@@ -1,5 +1,9 @@
-from typing import Generator
+from typing import Dict, Generator
+from datetime import datetime, timezone
+from decimal import Decimal
 import pytest
+from app import models
+from app.database import get_session, reset_db
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +14,56 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture()
+def clean_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture()
+def job_inputs(clean_db) -> Dict[str, int]:
+    """A user with one of each job input; returns the foreign keys a VideoGenerationJob needs."""
+    with get_session() as session:
+        owner = models.User(username="creator", email="creator@example.com")
+        session.add(owner)
+        session.commit()
+        assert owner.id is not None
+
+        post = models.RedditPost(
+            reddit_id="abc123",
+            subreddit="stories",
+            title="A story",
+            author="poster",
+            created_utc=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            url="https://reddit.com/r/stories/abc123",
+            permalink="/r/stories/abc123",
+            user_id=owner.id,
+        )
+        video = models.BackgroundVideo(
+            filename="bg.mp4",
+            original_filename="bg.mp4",
+            file_path="/videos/bg.mp4",
+            file_size=1024,
+            duration=Decimal("60.00"),
+            width=1080,
+            height=1920,
+            fps=Decimal("30.00"),
+            user_id=owner.id,
+        )
+        tts = models.TTSConfiguration(name="Default", voice_id="alloy", voice_name="Alloy", user_id=owner.id)
+        style = models.SubtitleStyle(name="Default", user_id=owner.id)
+        session.add_all([post, video, tts, style])
+        session.commit()
+        assert post.id is not None and video.id is not None
+        assert tts.id is not None and style.id is not None
+
+        return {
+            "user_id": owner.id,
+            "reddit_post_id": post.id,
+            "background_video_id": video.id,
+            "tts_config_id": tts.id,
+            "subtitle_style_id": style.id,
+        }
@@ -0,0 +1,47 @@
+from sqlalchemy.pool import QueuePool
+from sqlmodel import select, text
+
+from app.database import DATABASE_URL, ENGINE, POOL_OPTIONS, create_async_app_engine, get_async_session, get_session
+from app.models import TTSConfiguration, User
+
+
+def test_engine_pool_configured():
+    assert isinstance(ENGINE.pool, QueuePool)
+    assert ENGINE.pool.size() == POOL_OPTIONS["pool_size"]
+
+
+async def test_async_session_queries(clean_db):
+    async with get_async_session() as session:
+        session.add(User(username="alice", email="alice@example.com"))
+        await session.commit()
+
+        result = await session.exec(select(User).where(User.username == "alice"))
+        user = result.first()
+
+        assert user is not None
+        assert user.email == "alice@example.com"
+
+
+async def test_async_engine_accepts_libpq_ssl_params():
+    separator = "&" if "?" in DATABASE_URL else "?"
+    engine = create_async_app_engine(f"{DATABASE_URL}{separator}sslmode=disable&channel_binding=prefer")
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+    finally:
+        await engine.dispose()
+
+
+def test_json_columns_round_trip(job_inputs):
+    settings = {"model": "tts-1", "tags": ["cats", "café"], "limits": {"max": 3}}
+    with get_session() as session:
+        config = session.get(TTSConfiguration, job_inputs["tts_config_id"])
+        assert config is not None
+        config.settings = settings
+        session.add(config)
+        session.commit()
+
+    with get_session() as session:
+        config = session.get(TTSConfiguration, job_inputs["tts_config_id"])
+        assert config is not None
+        assert config.settings == settings
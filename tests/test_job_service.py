@@ -0,0 +1,204 @@
+import pytest
+import warnings
+from typing import List
+from datetime import datetime, timezone
+from decimal import Decimal
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import select
+
+from app.database import ENGINE, get_session
+from app.job_service import create_job, get_job_detail, list_jobs, update_job
+from app.models import (
+    JobProgressUpdate,
+    JobStatus,
+    TTSProvider,
+    VideoGenerationJob,
+    VideoGenerationJobCreate,
+    VideoGenerationJobDetail,
+    VideoGenerationJobUpdate,
+    VideoFormat,
+)
+
+
+@pytest.fixture()
+def user_id(job_inputs) -> int:
+    with get_session() as session:
+        for name, status in [("first", JobStatus.COMPLETED), ("second", JobStatus.PENDING)]:
+            job = VideoGenerationJob(
+                job_name=name,
+                status=status,
+                target_duration=Decimal("45.00"),
+                detail=VideoGenerationJobDetail(processing_log=[f"{name} queued"]),
+                **job_inputs,
+            )
+            session.add(job)
+            session.commit()
+            assert job.id is not None
+            for percentage, step in [(Decimal("10.00"), "fetch"), (Decimal("50.00"), "render")]:
+                session.add(
+                    JobProgressUpdate(
+                        progress_percentage=percentage,
+                        step_name=step,
+                        video_job_id=job.id,
+                        created_at=datetime(2024, 1, 1, 0, 0, int(percentage), tzinfo=timezone.utc),
+                    )
+                )
+        session.commit()
+        return job_inputs["user_id"]
+
+
+def test_list_jobs_loads_inputs_eagerly(user_id):
+    with get_session() as session:
+        jobs = list_jobs(session, user_id, raise_on_lazy=True)
+
+        assert {job.job_name for job in jobs} == {"first", "second"}
+        for job in jobs:
+            assert job.reddit_post.reddit_id == "abc123"
+            assert job.background_video.filename == "bg.mp4"
+            assert job.tts_config.voice_id == "alloy"
+            assert job.subtitle_style.name == "Default"
+            assert [update.step_name for update in job.progress_updates] == ["fetch", "render"]
+
+        # Relationships outside the eager set must not silently lazy-load
+        with pytest.raises(InvalidRequestError):
+            _ = jobs[0].user
+
+
+def test_loaded_enums_are_members(user_id):
+    with get_session() as session:
+        job = list_jobs(session, user_id, status=JobStatus.COMPLETED)[0]
+
+        assert job.status is JobStatus.COMPLETED
+        assert job.output_format is VideoFormat.MP4
+        assert job.tts_config.provider is TTSProvider.OPENAI
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert job.model_dump(mode="json")["status"] == "completed"
+            assert '"provider":"openai"' in job.tts_config.model_dump_json()
+
+
+def test_list_jobs_filters_by_status(user_id):
+    with get_session() as session:
+        jobs = list_jobs(session, user_id, status=JobStatus.PENDING)
+
+        assert [job.job_name for job in jobs] == ["second"]
+
+
+def test_list_jobs_unknown_user(user_id):
+    with get_session() as session:
+        assert list_jobs(session, user_id + 1) == []
+
+
+def test_job_detail_loaded_separately(user_id):
+    with get_session() as session:
+        jobs = list_jobs(session, user_id, status=JobStatus.COMPLETED)
+        with pytest.raises(InvalidRequestError):
+            _ = jobs[0].detail
+        assert jobs[0].id is not None
+
+        detail = get_job_detail(session, jobs[0].id)
+        assert detail is not None
+        assert detail.processing_log == ["first queued"]
+        assert detail.error_message is None
+
+
+def test_job_detail_missing(clean_db):
+    with get_session() as session:
+        assert get_job_detail(session, 9999) is None
+
+
+def test_delete_job_removes_detail_and_progress(user_id):
+    with get_session() as session:
+        job = list_jobs(session, user_id, status=JobStatus.COMPLETED)[0]
+        job_id = job.id
+        assert job_id is not None
+        session.delete(job)
+        session.commit()
+
+        assert session.get(VideoGenerationJob, job_id) is None
+        assert get_job_detail(session, job_id) is None
+        assert session.exec(select(JobProgressUpdate).where(JobProgressUpdate.video_job_id == job_id)).all() == []
+
+
+def test_replace_job_detail(user_id):
+    with get_session() as session:
+        job = list_jobs(session, user_id, status=JobStatus.COMPLETED)[0]
+        job_id = job.id
+        assert job_id is not None
+        job.detail = VideoGenerationJobDetail(processing_log=["rerun queued"])
+        session.add(job)
+        session.commit()
+
+    with get_session() as session:
+        detail = get_job_detail(session, job_id)
+        assert detail is not None
+        assert detail.processing_log == ["rerun queued"]
+
+
+def test_create_job_routes_detail_fields(job_inputs):
+    data = VideoGenerationJobCreate.model_validate(
+        {"job_name": "new", "target_duration": "30.00", "processing_settings": {"voice": "alloy"}, **job_inputs}
+    )
+    with get_session() as session:
+        job = create_job(session, data)
+        session.commit()
+        job_id = job.id
+        assert job_id is not None
+
+    with get_session() as session:
+        detail = get_job_detail(session, job_id)
+        assert detail is not None
+        assert detail.processing_settings == {"voice": "alloy"}
+
+
+def test_update_job_routes_detail_fields(user_id):
+    with get_session() as session:
+        job_id = list_jobs(session, user_id, status=JobStatus.PENDING)[0].id
+        assert job_id is not None
+        update = VideoGenerationJobUpdate.model_validate(
+            {
+                "status": "failed",
+                "error_message": "render crashed",
+                "estimated_completion": "2024-01-01T12:00:00+00:00",
+                "output_filename": "out.mp4",
+            }
+        )
+        assert update_job(session, job_id, update) is not None
+        session.commit()
+
+    with get_session() as session:
+        job = session.get(VideoGenerationJob, job_id)
+        detail = get_job_detail(session, job_id)
+        assert job is not None and detail is not None
+        assert job.status == JobStatus.FAILED
+        assert detail.error_message == "render crashed"
+        assert detail.output_filename == "out.mp4"
+        assert detail.estimated_completion == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        assert detail.processing_log == ["second queued"]
+
+
+def test_update_job_skips_eager_loads(user_id):
+    with get_session() as session:
+        job_id = list_jobs(session, user_id, status=JobStatus.PENDING)[0].id
+        assert job_id is not None
+
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(ENGINE, "before_cursor_execute", record)
+    try:
+        with get_session() as session:
+            update_job(session, job_id, VideoGenerationJobUpdate.model_validate({"progress_percentage": "75.00"}))
+            session.commit()
+    finally:
+        event.remove(ENGINE, "before_cursor_execute", record)
+
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "UPDATE"]
+
+
+def test_update_job_missing(clean_db):
+    with get_session() as session:
+        assert update_job(session, 9999, VideoGenerationJobUpdate.model_validate({"status": "failed"})) is None
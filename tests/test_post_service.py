@@ -0,0 +1,67 @@
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy.orm.attributes import instance_state
+from sqlalchemy.exc import InvalidRequestError
+
+from app.database import get_session
+from app.models import RedditPost, User
+from app.post_service import list_posts, search_posts
+
+
+def _post(reddit_id: str, title: str, content: str, user_id: int) -> RedditPost:
+    return RedditPost(
+        reddit_id=reddit_id,
+        subreddit="stories",
+        title=title,
+        content=content,
+        author="someone",
+        created_utc=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        url=f"https://reddit.com/{reddit_id}",
+        permalink=f"/r/stories/{reddit_id}",
+        user_id=user_id,
+    )
+
+
+def test_search_matches_title_and_content(job_inputs):
+    user_id = job_inputs["user_id"]
+    with get_session() as session:
+        session.add(_post("p1", "My neighbour's cats", "They keep climbing the fence", user_id))
+        session.add(_post("p2", "Worst job interview", "The manager asked about my cat", user_id))
+        session.add(_post("p3", "Road trip", "We drove for hours", user_id))
+        session.commit()
+
+        assert {post.reddit_id for post in search_posts(session, user_id, "cat")} == {"p1", "p2"}
+        assert [post.reddit_id for post in search_posts(session, user_id, "climbing fences")] == ["p1"]
+        assert search_posts(session, user_id, "spaceship") == []
+        assert search_posts(session, user_id + 1, "cat") == []
+
+
+def test_search_vec_follows_updates(job_inputs):
+    user_id = job_inputs["user_id"]
+    with get_session() as session:
+        post = _post("p1", "Untitled", "", user_id)
+        session.add(post)
+        session.commit()
+
+        post.content = "A haunted lighthouse"
+        session.add(post)
+        session.commit()
+
+        assert [p.reddit_id for p in search_posts(session, user_id, "lighthouse")] == ["p1"]
+
+
+def test_list_posts_replaces_user_collection(job_inputs):
+    user_id = job_inputs["user_id"]
+    with get_session() as session:
+        session.add(_post("p1", "First", "", user_id))
+        session.commit()
+
+        posts = list_posts(session, user_id)
+        assert {post.reddit_id for post in posts} == {"abc123", "p1"}
+        # The tsvector is deferred, so listings never fetch it
+        assert all("search_vec" in instance_state(post).unloaded for post in posts)
+
+        user = session.get(User, user_id)
+        assert user is not None
+        with pytest.raises(InvalidRequestError):
+            _ = user.reddit_posts
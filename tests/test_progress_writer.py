@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from decimal import Decimal
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import JobProgressUpdate, JobProgressUpdateCreate, VideoGenerationJob
+from app.progress_writer import ProgressWriter, write_progress_updates
+
+
+@pytest.fixture()
+def job_id(job_inputs) -> int:
+    with get_session() as session:
+        job = VideoGenerationJob(job_name="render", target_duration=Decimal("30.00"), **job_inputs)
+        session.add(job)
+        session.commit()
+        assert job.id is not None
+        return job.id
+
+
+def make_updates(job_id: int, count: int) -> list[JobProgressUpdateCreate]:
+    return [
+        JobProgressUpdateCreate(progress_percentage=Decimal(i), step_name=f"step {i}", video_job_id=job_id)
+        for i in range(count)
+    ]
+
+
+def stored_steps(job_id: int) -> list[str]:
+    with get_session() as session:
+        rows = session.exec(select(JobProgressUpdate).where(JobProgressUpdate.video_job_id == job_id)).all()
+        return sorted(row.step_name for row in rows)
+
+
+def test_write_progress_updates_batch(job_id):
+    with get_session() as session:
+        write_progress_updates(session, make_updates(job_id, 3))
+        session.commit()
+
+        rows = session.exec(select(JobProgressUpdate)).all()
+        assert sorted(row.step_name for row in rows) == ["step 0", "step 1", "step 2"]
+        assert all(row.created_at is not None for row in rows)
+        assert all(row.update_metadata == {} for row in rows)
+
+
+def test_write_progress_updates_empty(job_id):
+    with get_session() as session:
+        write_progress_updates(session, [])
+        session.commit()
+
+    assert stored_steps(job_id) == []
+
+
+async def test_progress_writer_flushes_on_stop(job_id):
+    writer = ProgressWriter(batch_size=100, flush_interval=60)
+    writer.start()
+    for update in make_updates(job_id, 3):
+        writer.put(update)
+
+    await writer.stop()
+
+    assert stored_steps(job_id) == ["step 0", "step 1", "step 2"]
+
+
+async def test_progress_writer_flushes_full_batch(job_id):
+    writer = ProgressWriter(batch_size=2, flush_interval=60)
+    writer.start()
+    for update in make_updates(job_id, 2):
+        writer.put(update)
+
+    for _ in range(50):
+        if stored_steps(job_id):
+            break
+        await asyncio.sleep(0.05)
+    assert stored_steps(job_id) == ["step 0", "step 1"]
+
+    await writer.stop()
+
+
+async def test_progress_writer_keeps_other_jobs_on_stale_row(job_id):
+    writer = ProgressWriter(batch_size=100, flush_interval=60)
+    writer.start()
+    writer.put(make_updates(job_id, 1)[0])
+    writer.put(make_updates(job_id + 1000, 1)[0])  # no such job: FK violation
+    writer.put(make_updates(job_id, 2)[1])
+
+    await writer.stop()
+
+    assert stored_steps(job_id) == ["step 0", "step 1"]
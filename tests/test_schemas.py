@@ -0,0 +1,109 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from pydantic import ValidationError
+
+from app.models import (
+    JobStatus,
+    RedditPost,
+    SubtitleStyle,
+    SubtitleStyleCreate,
+    SubtitleStyleUpdate,
+    TTSConfigurationUpdate,
+    UserUpdate,
+    VideoGenerationJobUpdate,
+    RedditPostCreate,
+    make_partial,
+)
+
+
+def test_partial_update_keeps_source_constraints():
+    with pytest.raises(ValidationError):
+        TTSConfigurationUpdate.model_validate({"speed": Decimal("5.0")})
+
+    assert TTSConfigurationUpdate.model_validate({"speed": "1.5"}).model_dump()["speed"] == Decimal("1.5")
+
+
+def test_partial_update_only_reports_set_fields():
+    update = VideoGenerationJobUpdate.model_validate({"status": "failed", "error_message": "render crashed"})
+
+    assert update.model_dump(exclude_unset=True) == {"status": JobStatus.FAILED, "error_message": "render crashed"}
+
+
+def test_partial_update_rejects_fields_outside_include():
+    with pytest.raises(ValidationError):
+        VideoGenerationJobUpdate.model_validate({"user_id": 1})
+
+
+def test_make_partial_naming():
+    assert make_partial(RedditPost, include=("title",)).__name__ == "RedditPostUpdate"
+    assert make_partial(RedditPost, include=("title",), name="TitleEdit").__name__ == "TitleEdit"
+    assert [cls.__name__ for cls in UserUpdate.__mro__[:2]] == ["UserUpdate", "UserUpdateBase"]
+
+
+def test_make_partial_unknown_field():
+    with pytest.raises(KeyError, match="titel"):
+        make_partial(RedditPost, include=("titel",))
+
+
+def test_subtitle_colors_stored_as_rgb():
+    create = SubtitleStyleCreate.model_validate({"name": "Neon", "user_id": 1, "font_color": "#00ff7f"})
+    style = SubtitleStyle.model_validate(create)
+
+    assert style.font_color_rgb == 0x00FF7F
+    assert style.font_color == "#00FF7F"
+    assert style.background_color is None
+
+    style.sqlmodel_update(SubtitleStyleUpdate.model_validate({"background_color": "#101010"}))
+    assert style.background_color_rgb == 0x101010
+    assert style.name == "Neon"
+
+
+def test_subtitle_constructor_accepts_hex_colors():
+    style = SubtitleStyle(name="Alert", user_id=1, font_color="#FF0000", outline_color="#0000ff")
+
+    assert style.font_color_rgb == 0xFF0000
+    assert style.outline_color_rgb == 0x0000FF
+    assert style.background_color_rgb is None
+
+
+def test_subtitle_dump_includes_hex_colors():
+    dumped = SubtitleStyle(name="Alert", user_id=1, background_color="#101010").model_dump()
+
+    assert dumped["font_color"] == "#FFFFFF"
+    assert dumped["background_color"] == "#101010"
+    assert dumped["outline_color"] == "#000000"
+    assert dumped["background_color_rgb"] == 0x101010
+
+
+def test_subtitle_colors_reject_invalid_hex():
+    with pytest.raises(ValueError, match="expected #RRGGBB"):
+        SubtitleStyle(name="Bad", user_id=1, font_color="white")
+    with pytest.raises(ValidationError):
+        SubtitleStyle.model_validate({"name": "Bad", "user_id": 1, "outline_color": "#12345"})
+    with pytest.raises(ValidationError):
+        SubtitleStyleCreate.model_validate({"name": "Bad", "user_id": 1, "font_color": "white"})
+    with pytest.raises(ValidationError):
+        SubtitleStyleUpdate.model_validate({"outline_color": "#12345"})
+
+
+def test_datetimes_must_be_timezone_aware():
+    with pytest.raises(ValidationError):
+        VideoGenerationJobUpdate.model_validate({"estimated_completion": datetime(2024, 1, 1)})
+
+    update = VideoGenerationJobUpdate.model_validate({"estimated_completion": "2024-01-01T12:00:00+02:00"})
+    assert update.model_dump()["estimated_completion"].utcoffset() is not None
+
+    with pytest.raises(ValidationError):
+        RedditPostCreate.model_validate(
+            {
+                "reddit_id": "abc",
+                "subreddit": "stories",
+                "title": "Title",
+                "author": "someone",
+                "created_utc": "2024-01-01T00:00:00",
+                "url": "https://reddit.com/abc",
+                "permalink": "/r/stories/abc",
+                "user_id": 1,
+            }
+        )
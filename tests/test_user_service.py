@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.database import get_session
+from app.models import User, UserCreate
+from app.user_service import get_user_by_email, get_user_by_username
+
+
+def test_user_create_normalizes_case():
+    data = UserCreate(username=" Alice ", email="Alice@Example.com")
+
+    assert data.username == "alice"
+    assert data.email == "alice@example.com"
+
+
+def test_lookup_ignores_case(clean_db):
+    with get_session() as session:
+        session.add(User.model_validate(UserCreate(username="alice", email="alice@example.com")))
+        session.commit()
+
+        by_email = get_user_by_email(session, "ALICE@example.COM")
+        by_username = get_user_by_username(session, "Alice")
+
+        assert by_email is not None and by_email.username == "alice"
+        assert by_username is not None and by_username.email == "alice@example.com"
+        assert get_user_by_email(session, "bob@example.com") is None
+
+
+def test_email_unique_regardless_of_case(clean_db):
+    with get_session() as session:
+        session.add(User(username="alice", email="alice@example.com"))
+        session.commit()
+
+        session.add(User(username="alice2", email="Alice@Example.com"))
+        with pytest.raises(IntegrityError):
+            session.commit()